@@ -1,26 +1,27 @@
-from abc import ABC, abstractmethod
+import io
+import sys
+from contextlib import redirect_stdout
+from typing import Protocol
 
-class Payment(ABC):
-    @abstractmethod
+class Payment(Protocol):
     def pay(self, amount):
-        pass
+        ...
 
-class CreditCardPayment(Payment):
+class CreditCardPayment:
     def pay(self, amount):
         print(f"Paid £{amount} using Credit Card.")
 
-class PayPalPayment(Payment):
+class PayPalPayment:
     def pay(self, amount):
         print(f"Paid £{amount} via PayPal.")
 
-payment = CreditCardPayment()
-payment.pay(100)  # Output: "Paid £100 using Credit Card"
-
 
 
 
 
 class BankAccount:
+    __slots__ = ("owner", "_BankAccount__balance")
+
     def __init__(self, owner, balance=0):
         self.owner = owner
         self.__balance = balance  # private attribute
@@ -36,14 +37,13 @@ class BankAccount:
     def get_balance(self):
         return self.__balance
 
-account = BankAccount("Alice", 100)
-account.deposit(50)
-print(account.get_balance())  # Output: 150
 
 
 
 
 class Vehicle:
+    __slots__ = ("brand",)
+
     def __init__(self, brand):
         self.brand = brand
 
@@ -51,17 +51,17 @@ class Vehicle:
         print("Vehicle is moving")
 
 class Car(Vehicle):
+    __slots__ = ()
+
     def move(self):
         print(f"{self.brand} car is driving on the road")
 
 class Boat(Vehicle):
+    __slots__ = ()
+
     def move(self):
         print(f"{self.brand} boat is sailing on water")
 
-# Demonstration
-for v in [Car("Toyota"), Boat("Yamaha")]:
-    v.move()  # Output: "Toyota car is driving on the road. 
-              # Yamaha boat is sailing on water"
 
 
 
@@ -77,6 +77,24 @@ class Cat:
 def make_sound(animal):
     print(animal.speak())
 
-# Both objects share the same interface
-make_sound(Dog())  # Output: "Woof!"
-make_sound(Cat())  # Output: "Meow!"
+
+# Demonstration – only runs as a script; output is collected and written once
+if __name__ == "__main__":
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        payment = CreditCardPayment()
+        payment.pay(100)  # Output: "Paid £100 using Credit Card"
+
+        account = BankAccount("Alice", 100)
+        account.deposit(50)
+        print(account.get_balance())  # Output: 150
+
+        for v in [Car("Toyota"), Boat("Yamaha")]:
+            v.move()  # Output: "Toyota car is driving on the road.
+                      # Yamaha boat is sailing on water"
+
+        # Both objects share the same interface
+        make_sound(Dog())  # Output: "Woof!"
+        make_sound(Cat())  # Output: "Meow!"
+
+    sys.stdout.write(buf.getvalue())
@@ -1,86 +1,132 @@
 # ============ Domain model ============
 
-from abc import ABC, abstractmethod
+import math
+import sys
+from fractions import Fraction
+from typing import Protocol
+
+# Abstraction – structural contract for anything with a per-day late fee
+class FeeRated(Protocol):
+    FEE_PER_DAY: int  # pence
+
+# Shared base for all loanable items
+class LoanItem:
+    __slots__ = ("title", "max_days")
+    FEE_PER_DAY: int  # pence – declared here, set by each concrete item type
 
-# Abstraction – shared interface for all loanable items
-class LoanItem(ABC):
     def __init__(self, title, max_days):
+        # Keep the old abstract-base guarantee: fail at construction, not at return time
+        if not hasattr(type(self), "FEE_PER_DAY"):
+            raise TypeError(f"Can't instantiate {type(self).__name__} without FEE_PER_DAY")
         self.title = title
         self.max_days = max_days
 
-    @abstractmethod
-    def late_fee_per_day(self):
-        pass
-
-# Inheritance – concrete item types extend the abstract base
+# Inheritance – concrete item types extend the shared base
 class Book(LoanItem):
-    def late_fee_per_day(self):
-        return 0.25
+    __slots__ = ()
+    FEE_PER_DAY = 25  # pence
 
 class DVD(LoanItem):
-    def late_fee_per_day(self):
-        return 0.75
+    __slots__ = ()
+    FEE_PER_DAY = 75  # pence
+
 
+# Pounds -> exact (unrounded) pence; None for NaN/inf. Exact arithmetic means
+# huge ints and floats near the top of the float range never overflow.
+def _to_pence(amount):
+    if isinstance(amount, int):
+        return amount * 100
+    if isinstance(amount, float) and not math.isfinite(amount):
+        return None
+    return Fraction(amount) * 100
 
 # Encapsulation – balance is private; controlled via methods
 class MemberAccount:
+    __slots__ = ("name", "_MemberAccount__pence")
+
     def __init__(self, name):
-        self.name = name
-        self.__balance = 0.0  # private
+        self.name = sys.intern(name)  # interned – cheaper dict keying in Library._loans
+        self.__pence = 0  # private; whole pence keep the arithmetic exact
 
     def add_charge(self, amount):
-        if amount > 0:
-            self.__balance += amount
+        # Charges under half a penny round to 0p and are ignored
+        exact = _to_pence(amount)
+        if exact is not None:
+            self.add_charge_pence(round(exact))
+
+    def add_charge_pence(self, pence):
+        if pence > 0:
+            self.__pence += pence
 
     def pay(self, amount):
-        if 0 < amount <= self.__balance:
-            self.__balance -= amount
-            return True
-        return False
+        # Bound-check the unrounded amount so nothing over the balance is accepted
+        exact = _to_pence(amount)
+        if exact is None or exact > self.__pence:
+            return False
+        p = round(exact)
+        if p <= 0:
+            return False
+        self.__pence -= p
+        return True
 
     def balance(self):
-        return round(self.__balance, 2)
+        return self.__pence / 100
+
+    def reset(self):
+        self.__pence = 0
 
 
 # ============ Policies & Ports (SOLID) ============
 
 # OCP – strategy for fee calculation; extend with new policies without modifying Library
-class LateFeePolicy(ABC):
-    @abstractmethod
-    def compute_fee(self, item: LoanItem, days_late: int) -> float:
-        pass
+class LateFeePolicy(Protocol):
+    def compute_fee(self, item: FeeRated, days_late: int) -> int:  # pence
+        ...
 
-class StandardPolicy(LateFeePolicy):
+class StandardPolicy:
     def compute_fee(self, item, days_late):
         if days_late <= 0:
-            return 0.0
-        return days_late * item.late_fee_per_day()
+            return 0
+        return days_late * item.FEE_PER_DAY
 
-class ChildrenPolicy(LateFeePolicy):
+class ChildrenPolicy:
     # e.g., first 2 late days are free for children’s accounts
     def compute_fee(self, item, days_late):
         days = max(0, days_late - 2)
-        return days * item.late_fee_per_day()
+        return days * item.FEE_PER_DAY
 
 
 # ISP – small focused interfaces instead of one bloated service
-class Notifier(ABC):
-    @abstractmethod
+class Notifier(Protocol):
     def notify(self, member: MemberAccount, message: str):
-        pass
+        ...
 
-class PaymentGateway(ABC):
-    @abstractmethod
+class PaymentGateway(Protocol):
     def charge(self, member: MemberAccount, amount: float) -> bool:
-        pass
+        ...
 
 
 # DIP – Library depends on abstractions (Notifier, PaymentGateway, LateFeePolicy)
-class EmailNotifier(Notifier):
+class EmailNotifier:
+    # Messages are buffered and written in one go on flush(); quiet drops them
+    __slots__ = ("_buf", "quiet")
+
+    def __init__(self, quiet=False):
+        self._buf = []
+        self.quiet = quiet
+
     def notify(self, member, message):
-        print(f"[Email] To {member.name}: {message}")
+        if self.quiet:
+            return
+        self._buf.append((member.name, message))
+
+    def flush(self):
+        if not self._buf:
+            return
+        print("\n".join(f"[Email] To {n}: {m}" for n, m in self._buf))
+        self._buf.clear()
 
-class ConsolePayment(PaymentGateway):
+class ConsolePayment:
     def charge(self, member, amount):
         # In real life, integrate Stripe etc. Here we just apply the payment.
         ok = member.pay(amount)
@@ -96,21 +142,33 @@ class Library:
         self.notifier = notifier
         self.payments = payments
         self.policy = policy
-        self._loans = {}  # member.name -> list of LoanItem
+        # member.name -> {id(item): LoanItem}, insertion-ordered. A loan is one
+        # item object, so checking out the same copy twice records it once.
+        self._loans = {}
+
+    # OCP – policy can be swapped at runtime; cache its bound compute_fee on assignment
+    @property
+    def policy(self):
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: LateFeePolicy):
+        self._policy = policy
+        self._compute_fee = policy.compute_fee
 
     def checkout(self, member: MemberAccount, item: LoanItem):
-        self._loans.setdefault(member.name, []).append(item)
+        self._loans.setdefault(member.name, {})[id(item)] = item
         self.notifier.notify(member, f'Checked out "{item.title}" for up to {item.max_days} days.')
 
-    # Polymorphism – uses item.late_fee_per_day() regardless of concrete type
+    # Polymorphism – uses item.FEE_PER_DAY regardless of concrete type
     def return_item(self, member: MemberAccount, item: LoanItem, days_late: int):
-        items = self._loans.get(member.name, [])
-        if item in items:
-            items.remove(item)
-        fee = self.policy.compute_fee(item, days_late)
+        items = self._loans.get(member.name)
+        if items is not None:
+            items.pop(id(item), None)
+        fee = self._compute_fee(item, days_late)
         if fee > 0:
-            member.add_charge(fee)
-            self.notifier.notify(member, f'Late fee for "{item.title}": £{fee:.2f}. Current balance £{member.balance():.2f}.')
+            member.add_charge_pence(fee)
+            self.notifier.notify(member, f'Late fee for "{item.title}": £{fee / 100:.2f}. Current balance £{member.balance():.2f}.')
         else:
             self.notifier.notify(member, f'Returned on time: "{item.title}". No fee.')
 
@@ -118,9 +176,14 @@ class Library:
         self.payments.charge(member, amount)
         self.notifier.notify(member, f'Balance now £{member.balance():.2f}.')
 
+    def clear(self):
+        self._loans.clear()
+
     def list_loans(self, member: MemberAccount):
-        items = self._loans.get(member.name, [])
-        return [i.title for i in items]
+        items = self._loans.get(member.name)
+        if items is None:
+            return []
+        return [i.title for i in items.values()]
 
 
 # ============ Demo scenario ============
@@ -139,19 +202,25 @@ if __name__ == "__main__":
 
     library.checkout(alice, moby)
     library.checkout(alice, matrix)
+    library.notifier.flush()  # emit buffered emails after each step so the story reads in order
     print("Current loans:", library.list_loans(alice))
 
     # Return items with different lateness – polymorphism in fee via item type
     library.return_item(alice, moby, days_late=3)    # Book – cheaper per day
     library.return_item(alice, matrix, days_late=3)  # DVD – higher per day
+    library.notifier.flush()
 
     # Pay part of the balance
     library.pay_balance(alice, amount=1.00)
+    library.notifier.flush()
     library.pay_balance(alice, amount=10.00)
+    library.notifier.flush()
 
     # Swap fee policy at runtime – OCP illustrated without modifying Library
     library.policy = ChildrenPolicy()
     # Another late return under different policy
     library.return_item(alice, DVD("Spirited Away", max_days=7), days_late=2)
     library.return_item(alice, Book("Charlotte's Web", max_days=14), days_late=4)
+    library.notifier.flush()
     library.pay_balance(alice, amount=50.00)
+    library.notifier.flush()
@@ -1,4 +1,6 @@
-
+import io
+import sys
+from contextlib import redirect_stdout
 
 
 class InvoicePrinter:
@@ -26,8 +28,6 @@ class FixedDiscount(Discount):
 def calculate_price(discount_obj, price):
     return discount_obj.get_discount(price)
 
-print(calculate_price(PercentageDiscount(), 100))  # Output: 90.0
-
 
 
 
@@ -42,8 +42,6 @@ class Sparrow(Bird):
 def let_it_fly(bird):
     print(bird.fly())
 
-let_it_fly(Sparrow())  # Output: "Sparrow flying low"
-
 
 
 
@@ -57,13 +55,6 @@ class AllInOne:
     def scan_doc(self):
         print("Scanning document...")
 
-hp = BasicPrinter()
-hp.print_doc()  # Output: "Printing document..."
-
-canon = AllInOne()
-canon.print_doc()  # Output: "Printing document..."
-canon.scan_doc()  # Output: "Scanning document..."
-
 
 
 
@@ -86,12 +77,27 @@ class Car:
     def start(self):
         self.engine.start()
 
-# Use any engine without changing Car
-car1 = Car(DieselEngine())
-car1.start()  # Output: "Diesel engine starting..."
 
-car2 = Car(ElectricEngine())
-car2.start()  # Output: "Electric motor powering up..."
+# Demonstration – only runs as a script; output is collected and written once
+if __name__ == "__main__":
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print(calculate_price(PercentageDiscount(), 100))  # Output: 90.0
+
+        let_it_fly(Sparrow())  # Output: "Sparrow flying low"
+
+        hp = BasicPrinter()
+        hp.print_doc()  # Output: "Printing document..."
+
+        canon = AllInOne()
+        canon.print_doc()  # Output: "Printing document..."
+        canon.scan_doc()  # Output: "Scanning document..."
 
+        # Use any engine without changing Car
+        car1 = Car(DieselEngine())
+        car1.start()  # Output: "Diesel engine starting..."
 
+        car2 = Car(ElectricEngine())
+        car2.start()  # Output: "Electric motor powering up..."
 
+    sys.stdout.write(buf.getvalue())
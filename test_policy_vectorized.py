@@ -0,0 +1,39 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+numba = pytest.importorskip("numba")
+
+from demo import Book, DVD, StandardPolicy, ChildrenPolicy
+
+# ---------- Vectorized sweep of the late-fee policies ----------
+
+@numba.njit(cache=True)
+def fees(days, rate, free):
+    # Mirrors StandardPolicy (free=0) and ChildrenPolicy (free=2)
+    out = np.empty_like(days, dtype=np.float64)
+    for i in range(days.size):
+        d = days[i] - free
+        out[i] = d * rate if d > 0 else 0.0
+    return out
+
+DAYS = np.arange(-365, 10001)
+# The kernel is an oracle for the policies: it sweeps the full range at C speed,
+# and the real compute_fee is checked against it on boundaries plus a strided sample.
+SAMPLE_DAYS = np.unique(np.concatenate([np.arange(-2, 5), DAYS[::97], DAYS[-1:]]))
+
+POLICIES = [
+    (StandardPolicy(), 0),
+    (ChildrenPolicy(), 2),
+]
+
+@pytest.mark.parametrize("free", [0, 2])
+@pytest.mark.parametrize("item", [Book, DVD])
+def test_kernel_never_negative_over_full_range(free, item):
+    assert (fees(DAYS, item.FEE_PER_DAY, free) >= 0).all()
+
+@pytest.mark.parametrize("policy, free", POLICIES)
+@pytest.mark.parametrize("item", [Book("Moby Dick", 14), DVD("The Matrix", 7)])
+def test_policy_matches_kernel(policy, free, item):
+    expected = fees(SAMPLE_DAYS, item.FEE_PER_DAY, free)
+    actual = [policy.compute_fee(item, int(d)) for d in SAMPLE_DAYS]
+    assert actual == expected.tolist()
@@ -1,9 +1,9 @@
 import pytest
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 
 # Import from your demo module
 from demo import (
-    MemberAccount, Book, DVD, Library,
+    MemberAccount, LoanItem, Book, DVD, Library,
     EmailNotifier, ConsolePayment, StandardPolicy, ChildrenPolicy
 )
 
@@ -12,7 +12,16 @@ def make_lib(policy="standard"):
         policy_obj = ChildrenPolicy()
     else:
         policy_obj = StandardPolicy()
-    return Library(EmailNotifier(), ConsolePayment(), policy_obj)
+    return Library(EmailNotifier(quiet=True), ConsolePayment(), policy_obj)
+
+# Built once per module; property tests reset the mutable state per example
+@pytest.fixture(scope="module")
+def std_setup():
+    return make_lib(), MemberAccount("Bob"), DVD("The Matrix", 7)
+
+@pytest.fixture(scope="module")
+def children_setup():
+    return make_lib(policy="children"), MemberAccount("Carol"), Book("Moby Dick", 14)
 
 # ---------- Misuse tests (explicit negative/invalid inputs) ----------
 
@@ -30,6 +39,50 @@ def test_negative_payment_is_rejected():
     assert ok is False
     assert m.balance() == 10.0
 
+@pytest.mark.parametrize("amount", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_payment_is_rejected(amount):
+    m = MemberAccount("Omar")
+    m.add_charge(5.0)
+    assert m.pay(amount) is False
+    assert m.balance() == 5.0
+
+@pytest.mark.parametrize("amount", [float("nan"), float("inf")])
+def test_non_finite_charge_is_ignored(amount):
+    m = MemberAccount("Uma")
+    m.add_charge(amount)
+    assert m.balance() == 0.0
+
+def test_large_finite_amounts_do_not_overflow():
+    m = MemberAccount("Hal")
+    m.add_charge(1e308)
+    assert m.balance() == 1e308
+    m.reset()
+    assert m.pay(10**310) is False   # over the (zero) balance, rejected without raising
+    m.add_charge(10**310)
+    assert m.pay(10**310) is True
+    assert m.balance() == 0.0
+
+def test_overpay_by_fraction_of_penny_is_rejected():
+    m = MemberAccount("Kit")
+    m.add_charge(10.0)
+    assert m.pay(10.004) is False
+    assert m.balance() == 10.0
+
+def test_sub_half_penny_amounts_are_ignored():
+    m = MemberAccount("Pip")
+    m.add_charge(0.004)         # rounds to 0p – no charge
+    assert m.balance() == 0.0
+    m.add_charge(1.0)
+    assert m.pay(0.004) is False
+    assert m.balance() == 1.0
+
+def test_balance_is_exact_in_pence():
+    m = MemberAccount("Ivy")
+    for _ in range(3):
+        m.add_charge(0.1)       # 0.1 + 0.1 + 0.1 != 0.3 in floats
+    assert m.pay(0.3) is True
+    assert m.balance() == 0.0
+
 def test_checkout_and_return_removes_item_from_loans():
     L = make_lib()
     m = MemberAccount("Sam")
@@ -39,6 +92,48 @@ def test_checkout_and_return_removes_item_from_loans():
     L.return_item(m, b, days_late=0)
     assert "Test Book" not in L.list_loans(m)
 
+def test_checking_out_same_copy_twice_is_one_loan():
+    L = make_lib()
+    m = MemberAccount("Tess")
+    b = Book("Dune", 14)
+    L.checkout(m, b)
+    L.checkout(m, b)
+    assert L.list_loans(m) == ["Dune"]
+    L.return_item(m, b, days_late=0)
+    assert L.list_loans(m) == []
+
+def test_swapping_policy_at_runtime_uses_new_policy():
+    L = make_lib()
+    m = MemberAccount("Rae")
+    d = DVD("Spirited Away", 7)
+    L.checkout(m, d)
+    L.policy = ChildrenPolicy()
+    L.return_item(m, d, days_late=2)   # free under ChildrenPolicy, £1.50 under StandardPolicy
+    assert m.balance() == 0.0
+
+def test_loan_item_without_fee_rate_cannot_be_built():
+    with pytest.raises(TypeError):
+        LoanItem("Generic", 3)
+
+# ---------- Notifier buffering ----------
+
+def test_quiet_notifier_drops_messages(capsys):
+    n = EmailNotifier(quiet=True)
+    n.notify(MemberAccount("Quinn"), "hello")
+    n.flush()
+    assert capsys.readouterr().out == ""
+
+def test_flush_writes_buffered_lines_once_then_clears(capsys):
+    n = EmailNotifier()
+    m = MemberAccount("Fay")
+    n.notify(m, "first")
+    n.notify(m, "second")
+    assert capsys.readouterr().out == ""    # nothing written until flush
+    n.flush()
+    assert capsys.readouterr().out == "[Email] To Fay: first\n[Email] To Fay: second\n"
+    n.flush()
+    assert capsys.readouterr().out == ""    # buffer was cleared
+
 # ---------- Fuzz/property tests (Hypothesis generates inputs) ----------
 
 @given(amount=st.floats(min_value=-1e6, max_value=1e6, allow_nan=False, allow_infinity=False))
@@ -50,21 +145,24 @@ def test_random_payments_never_create_negative_balance(amount):
     # Library logic ensures balance never dips below zero
     assert m.balance() >= 0.0
 
+# Bulk coverage of the fee arithmetic lives in test_policy_vectorized.py
+@settings(max_examples=25, deadline=None)
 @given(days=st.integers(min_value=-365, max_value=10000))
-def test_days_late_never_produces_negative_fee(days):
-    L = make_lib()
-    m = MemberAccount("Bob")
-    d = DVD("The Matrix", 7)
+def test_days_late_never_produces_negative_fee(std_setup, days):
+    L, m, d = std_setup
+    L.clear()
+    m.reset()
     L.checkout(m, d)
     L.return_item(m, d, days_late=days)
-    # Fees are added via add_charge, which never subtracts
+    # Fees are added via add_charge_pence, which never subtracts
     assert m.balance() >= 0.0
 
+@settings(max_examples=25, deadline=None)
 @given(days=st.integers(min_value=-365, max_value=10000))
-def test_children_policy_never_negative_fee(days):
-    L = make_lib(policy="children")
-    m = MemberAccount("Carol")
-    b = Book("Moby Dick", 14)
+def test_children_policy_never_negative_fee(children_setup, days):
+    L, m, b = children_setup
+    L.clear()
+    m.reset()
     L.checkout(m, b)
     L.return_item(m, b, days_late=days)
     assert m.balance() >= 0.0